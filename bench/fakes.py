@@ -0,0 +1,169 @@
+"""
+Stand-ins for the CircuitPython modules the game imports, so the game code in
+src/ can run under desktop Python. install() must be called before importing
+anything from src/.
+
+Only what the game touches is modelled: shapes and labels just hold their
+attributes, the NVM is a plain bytearray and the I2C device counts what it is
+asked to write.
+"""
+import sys
+import types
+
+
+class FakeClock:
+    """Replaces the time module inside game modules; time only moves when advance() is called."""
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakePin:
+    """A board pin whose level is set by the benchmark."""
+    def __init__(self, value=True):
+        self.value = value
+
+
+# ---------------- displayio / vectorio / terminalio ----------------
+class Group:
+    def __init__(self, *, x=0, y=0, scale=1):
+        self.x = x
+        self.y = y
+        self.scale = scale
+        self._items = []
+
+    def append(self, item):
+        self._items.append(item)
+
+    def remove(self, item):
+        self._items.remove(item)
+
+    def pop(self, i=-1):
+        return self._items.pop(i)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class Palette:
+    def __init__(self, count):
+        self._colors = [0] * count
+
+    def __setitem__(self, index, color):
+        self._colors[index] = color
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+
+class _Shape:
+    def __init__(self, *, pixel_shader, x=0, y=0):
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+
+
+class Rectangle(_Shape):
+    def __init__(self, *, pixel_shader, width, height, x=0, y=0):
+        super().__init__(pixel_shader=pixel_shader, x=x, y=y)
+        self.width = width
+        self.height = height
+
+
+class Circle(_Shape):
+    def __init__(self, *, pixel_shader, radius, x=0, y=0):
+        super().__init__(pixel_shader=pixel_shader, x=x, y=y)
+        self.radius = radius
+
+
+class Polygon(_Shape):
+    def __init__(self, *, pixel_shader, points, x=0, y=0):
+        super().__init__(pixel_shader=pixel_shader, x=x, y=y)
+        self.points = points
+
+
+class Label:
+    def __init__(self, font, *, text="", color=0xFFFFFF, scale=1, x=0, y=0):
+        self.font = font
+        self.text = text
+        self.color = color
+        self.scale = scale
+        self.x = x
+        self.y = y
+
+
+class Display:
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self.root_group = None
+
+
+# ---------------- digitalio ----------------
+class DigitalInOut:
+    def __init__(self, pin):
+        self._pin = pin
+
+    def switch_to_input(self, pull=None):
+        pass
+
+    @property
+    def value(self):
+        return self._pin.value
+
+
+# ---------------- adafruit_bus_device ----------------
+class I2CDevice:
+    """Accepts every write and counts the bytes, like an always-ready SSD1306."""
+    def __init__(self, i2c, device_address, probe=True):
+        self.device_address = device_address
+        self.bytes_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, buf, *, start=0, end=None):
+        if end is None: end = len(buf)
+        self.bytes_written += end - start
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    for key, value in attrs.items(): setattr(mod, key, value)
+    sys.modules[name] = mod
+    return mod
+
+
+def install():
+    """Registers the fake modules in sys.modules."""
+    _module("displayio", Group=Group, Palette=Palette, release_displays=lambda: None)
+    _module("vectorio", Rectangle=Rectangle, Circle=Circle, Polygon=Polygon)
+    _module("terminalio", FONT=object())
+    text_pkg = _module("adafruit_display_text")
+    text_pkg.label = _module("adafruit_display_text.label", Label=Label)
+    _module("microcontroller", nvm=bytearray(b"\xff" * 8192))
+    _module(
+        "digitalio",
+        DigitalInOut=DigitalInOut,
+        Pull=types.SimpleNamespace(UP="UP", DOWN="DOWN"),
+        Direction=types.SimpleNamespace(INPUT="INPUT", OUTPUT="OUTPUT"),
+    )
+    bus_pkg = _module("adafruit_bus_device")
+    bus_pkg.i2c_device = _module("adafruit_bus_device.i2c_device", I2CDevice=I2CDevice)
+
+
+def reset_nvm():
+    """Wipes the fake NVM back to the erased (0xFF) state."""
+    nvm = sys.modules["microcontroller"].nvm
+    nvm[:] = b"\xff" * len(nvm)
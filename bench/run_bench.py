@@ -0,0 +1,334 @@
+"""
+Headless Pocket Runner benchmarks.
+
+Runs the gameplay hot paths (spawn_entity, move/cull, check_collision,
+rendering), RotaryEncoder.update and HighScoreHandler.save_score under desktop
+Python against the fake hardware modules in fakes.py, then compares the
+results with the baselines and exits with status 1 if any metric regressed.
+
+    python bench/run_bench.py                    # run and check against the baselines
+    python bench/run_bench.py --only hard_run    # run matching scenarios only
+    python bench/run_bench.py --update-baseline  # store the current results as the baselines
+
+Allocation, bytes-sent and entity numbers are deterministic (fixed seeds,
+fake clock) and are shared in baseline.json. Times are host times, useful for
+comparing two versions of the code on the same machine, not for predicting
+frame times on the board, so they go to baseline.local.json (not committed)
+and are only checked once --update-baseline has been run on this machine.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import fakes
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+fakes.install()
+
+import pocket_runner                                  # noqa: E402
+import rotary_encoder                                 # noqa: E402
+from displayio_renderer import DisplayioRenderer      # noqa: E402
+from framebuffer_renderer import FramebufferRenderer  # noqa: E402
+from high_score import HighScoreHandler               # noqa: E402
+
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+LOCAL_BASELINE_PATH = os.path.join(HERE, "baseline.local.json")
+FRAME_TIME = 0.04   # Frame delay of the PLAY loop in code.py
+SEED = 2024
+
+# Ops timed together per sample, single ops are too short for perf_counter
+BATCH_OPS = 25
+
+# Metrics checked against the baselines; timing ones are per host and get the looser tolerance
+TIME_METRICS = ("median_us",)
+COUNT_METRICS = ("alloc_peak_bytes", "bytes_per_frame", "entities_max")
+
+
+# =========================================
+# Scenarios
+# =========================================
+# Each scenario builds fresh state and returns (ops, step, summary):
+# step(i) runs operation i, summary() returns extra metrics once all ops ran.
+
+def _make_renderer(kind):
+    if kind == "framebuffer": return FramebufferRenderer(None)
+    return DisplayioRenderer(fakes.Display())
+
+
+def _gameplay(kind, difficulty, frames, start_level):
+    random.seed(SEED)
+    clock = fakes.FakeClock()
+    pocket_runner.time = clock
+
+    game = pocket_runner.PocketRunner(_make_renderer(kind))
+    game.set_difficulty(difficulty)
+    game.reset_game()
+    game.renderer.begin_game()
+    # Jump straight to a later level, applying every level-up on the way
+    for level in range(2, start_level + 1):
+        game.update_level((level - 1) * 5)
+    clock.advance((start_level - 1) * 5)
+    level_frames = int(5 / FRAME_TIME)
+
+    paths = {"spawn_us": 0.0, "move_us": 0.0, "collision_us": 0.0, "render_us": 0.0}
+    stats = {"entities_max": 0, "entities_total": 0, "collisions": 0}
+
+    def step(i):
+        # Scripted tilt: switch lanes every 25 frames, drift left and right
+        game.current_lane_index = (i // 25) % 3
+        game.player_x += 2 if (i // 60) % 2 == 0 else -2
+
+        if start_level != 1 and i % level_frames == 0:
+            # Holding a later level: every 5 s rewind the game clock to the start
+            # of the level and reset the coin limit like a level-up does, so
+            # time_left stays within the level's real range
+            game.game_start_time = clock.monotonic() - (start_level - 1) * 5
+            game.coins_spawned_this_level = 0
+        total_elapsed = clock.monotonic() - game.game_start_time
+        game.time_left = int(50 - total_elapsed)
+        if start_level == 1: game.update_level(total_elapsed)
+        if game.coin_flash_timer > 0: game.coin_flash_timer -= 1
+        elif game.level_flash_timer > 0: game.level_flash_timer -= 1
+
+        t0 = time.perf_counter()
+        game.update_player_pos()
+        game.spawn_entity()
+        t1 = time.perf_counter()
+        game.move_entities()
+        t2 = time.perf_counter()
+        # Keep running after a hit so the whole scripted run is measured
+        if game.check_collision(): stats["collisions"] += 1
+        t3 = time.perf_counter()
+        game.renderer.set_hud(game.score, game.level, game.time_left)
+        game.renderer.end_frame()
+        t4 = time.perf_counter()
+
+        paths["spawn_us"] += (t1 - t0) * 1e6
+        paths["move_us"] += (t2 - t1) * 1e6
+        paths["collision_us"] += (t3 - t2) * 1e6
+        paths["render_us"] += (t4 - t3) * 1e6
+        entities = len(game.obstacles) + len(game.coins)
+        stats["entities_total"] += entities
+        if entities > stats["entities_max"]: stats["entities_max"] = entities
+        clock.advance(FRAME_TIME)
+
+    def summary():
+        r = game.renderer
+        result = {name: round(total / frames, 2) for name, total in paths.items()}
+        result["entities_max"] = stats["entities_max"]
+        result["entities_mean"] = round(stats["entities_total"] / frames, 2)
+        result["collisions"] = stats["collisions"]
+        result["score"] = game.score
+        result["bytes_per_frame"] = round(r.total_bytes_sent / max(1, r.frames), 1)
+        return result
+
+    return frames, step, summary
+
+
+def hard_run(kind):
+    """Full 50-second game on Hard, levels 1 to 10."""
+    return _gameplay(kind, "Hard", int(50 / FRAME_TIME), 1)
+
+
+def max_density(kind):
+    """Level 10 on Hard (tightest spawn gaps), held for 1000 frames."""
+    return _gameplay(kind, "Hard", 1000, 10)
+
+
+def encoder_edges():
+    """
+    10k quadrature edges through RotaryEncoder.update, reversing every 1000 edges.
+
+    Only measures cost: the driver's transition table counts the two directions
+    differently, so the final position is not expected to return to 0.
+    """
+    clock = fakes.FakeClock()
+    rotary_encoder.time = clock
+    pin_a = fakes.FakePin(True)
+    pin_b = fakes.FakePin(True)
+    encoder = rotary_encoder.RotaryEncoder(pin_a, pin_b, debounce_ms=3, pulses_per_detent=3)
+    sequence = ((False, True), (False, False), (True, False), (True, True))
+    edges = 10000
+    state = {"phase": 3, "changes": 0}  # Pins start high, sequence[3]
+
+    def step(i):
+        # Even calls move the pins, odd calls land after the debounce window
+        if i % 2 == 0:
+            direction = 1 if (i // 2000) % 2 == 0 else -1
+            state["phase"] = (state["phase"] + direction) % 4
+            pin_a.value, pin_b.value = sequence[state["phase"]]
+        else:
+            clock.advance(0.004)
+        if encoder.update(): state["changes"] += 1
+
+    def summary():
+        return {"edges": edges, "position_changes": state["changes"]}
+
+    return edges * 2, step, summary
+
+
+def highscore_saves():
+    """1000 HighScoreHandler.save_score calls into the fake NVM."""
+    random.seed(SEED)
+    fakes.reset_nvm()
+    handler = HighScoreHandler()
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+    def step(i):
+        name = alphabet[i % 26] + alphabet[(i * 7) % 26] + alphabet[(i * 13) % 26]
+        handler.save_score(random.randint(0, 0xFFFF), name)
+
+    def summary():
+        return {"top_score": handler.get_scores()[0]["score"]}
+
+    return 1000, step, summary
+
+
+SCENARIOS = {
+    "hard_run[displayio]": lambda: hard_run("displayio"),
+    "hard_run[framebuffer]": lambda: hard_run("framebuffer"),
+    "max_density[displayio]": lambda: max_density("displayio"),
+    "max_density[framebuffer]": lambda: max_density("framebuffer"),
+    "encoder_10k_edges": encoder_edges,
+    "highscore_saves": highscore_saves,
+}
+
+
+# =========================================
+# Measurement
+# =========================================
+def run_scenario(make, repeat):
+    """
+    Times `repeat` passes in batches of BATCH_OPS ops and keeps the pass with
+    the median per-op time, then replays the scenario under tracemalloc after
+    an untimed warm-up pass.
+    """
+    passes = []
+    for _ in range(repeat):
+        ops, step, summary = make()
+        samples = []
+        gc.disable()  # Like timeit, keep collector pauses out of the timings
+        for first in range(0, ops, BATCH_OPS):
+            last = min(first + BATCH_OPS, ops)
+            t0 = time.perf_counter()
+            for i in range(first, last): step(i)
+            samples.append((time.perf_counter() - t0) / (last - first))
+        gc.enable()
+        samples.sort()
+        passes.append((samples[len(samples) // 2], samples, summary()))
+    passes.sort(key=lambda p: p[0])
+    median, samples, result = passes[len(passes) // 2]
+
+    # Warm-up pass, so the replay does not depend on --repeat for first-call
+    # allocations (interned strings, cached ints, grown free lists)
+    ops, step, _ = make()
+    for i in range(ops): step(i)
+
+    # Replay the scenario (same seeds) with allocation tracing on
+    ops, step, _ = make()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    alloc_peak = 0
+    for i in range(ops):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        step(i)
+        _, peak = tracemalloc.get_traced_memory()
+        if peak - before > alloc_peak: alloc_peak = peak - before
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result.update({
+        "ops": ops,
+        "median_us": round(median * 1e6, 2),
+        "best_us": round(passes[0][0] * 1e6, 2),
+        "max_us": round(samples[-1] * 1e6, 2),
+        "alloc_peak_bytes": alloc_peak,
+        "alloc_net_bytes": end - start,
+    })
+    return result
+
+
+def _load(path):
+    if not os.path.exists(path): return {}
+    with open(path) as f: return json.load(f)
+
+
+def _store(path, results, metrics):
+    """Merges the given metrics of results into the baseline file at path."""
+    baseline = _load(path)
+    for name, result in results.items():
+        baseline[name] = {metric: result[metric] for metric in metrics if metric in result}
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Baseline written to {path}")
+
+
+def check(results, baseline, time_tolerance, time_floor, tolerance):
+    """
+    Returns a list of 'scenario metric: value > limit' strings for every regression.
+
+    Timing limits are never tighter than time_floor microseconds above the baseline, so
+    ops of a few microseconds do not fail on host noise.
+    """
+    failures = []
+    for name, result in results.items():
+        if name not in baseline: continue
+        for metric in TIME_METRICS + COUNT_METRICS:
+            if metric not in result or metric not in baseline[name]: continue
+            if metric in TIME_METRICS:
+                limit = max(baseline[name][metric] * (1 + time_tolerance), baseline[name][metric] + time_floor)
+            else:
+                limit = baseline[name][metric] * (1 + tolerance)
+            if result[metric] > limit:
+                failures.append(f"{name} {metric}: {result[metric]} > {round(limit, 2)}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Pocket Runner benchmarks")
+    parser.add_argument("--only", help="run only scenarios whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing passes per scenario, the median one is kept (default 5)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results to baseline.json and baseline.local.json")
+    parser.add_argument("--time-tolerance", type=float, default=0.5,
+                        help="allowed relative slowdown for timing metrics (default 0.5)")
+    parser.add_argument("--time-floor", type=float, default=5.0,
+                        help="slowdown in microseconds per op always allowed for timing metrics (default 5)")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed relative growth for allocation, bytes and entity metrics (default 0.1)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, make in SCENARIOS.items():
+        if args.only and args.only not in name: continue
+        results[name] = run_scenario(make, max(1, args.repeat))
+        print(name)
+        for metric, value in results[name].items(): print(f"    {metric:<18} {value}")
+
+    if args.update_baseline:
+        _store(BASELINE_PATH, results, COUNT_METRICS)
+        _store(LOCAL_BASELINE_PATH, results, TIME_METRICS)
+        return 0
+
+    baseline = _load(BASELINE_PATH)
+    local = _load(LOCAL_BASELINE_PATH)
+    if not baseline: print("No baseline.json, run with --update-baseline first")
+    if not local: print("No timing baseline for this machine, times are not checked")
+    for name, times in local.items(): baseline.setdefault(name, {}).update(times)
+    failures = check(results, baseline, args.time_tolerance, args.time_floor, args.tolerance)
+    for failure in failures: print("REGRESSION", failure)
+    if failures: return 1
+    print("All scenarios within baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import displayio
+import terminalio
+import vectorio
+from adafruit_display_text import label
+
+WHITE = 0xFFFFFF
+
+
+class DisplayioRenderer:
+    """
+    DisplayioRenderer(display)
+
+    Renders through the displayio scene graph: every entity is a vectorio shape
+    in game_group and the display refreshes whatever regions displayio marks dirty.
+
+    - bytes_sent: estimated I2C payload bytes for the last frame. displayio does
+      not expose its bus traffic, so every changed shape or label is counted as
+      one refresh area (old and new bounds, widened to whole 8-row pages) plus
+      its column/page addressing commands, the same way the SSD1306 is fed.
+    - total_bytes_sent / frames: running totals since the last reset_stats().
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+
+        self._palette = displayio.Palette(1)
+        self._palette[0] = WHITE
+
+        # Graphics Group: player + 3 HUD labels, entities are appended after them
+        self.game_group = displayio.Group()
+
+        # Create Player (Triangle Shape)
+        triangle_points = [(0, 0), (0, 12), (8, 6)]  # Narrow triangle
+        self.player_shape = vectorio.Polygon(pixel_shader=self._palette, points=triangle_points, x=0, y=0)
+        self.game_group.append(self.player_shape)
+
+        # UI Labels (Score, Level, Time)
+        self.score_label = label.Label(terminalio.FONT, text="Score:0", color=WHITE, x=0, y=5)
+        self.level_label = label.Label(terminalio.FONT, text="Lv:1", color=WHITE, x=50, y=5)
+        self.time_label = label.Label(terminalio.FONT, text="T:50", color=WHITE, x=90, y=5)
+        self.game_group.append(self.score_label)
+        self.game_group.append(self.level_label)
+        self.game_group.append(self.time_label)
+        self._ui_count = len(self.game_group)
+
+        self._boot_runner = None
+        self._dirty = []
+
+        self.bytes_sent = 0
+        self.total_bytes_sent = 0
+        self.frames = 0
+
+    def _mark(self, x0, y0, x1, y1):
+        """Records a changed area (inclusive bounds) for the bytes-sent estimate."""
+        self._dirty.append((x0, y0, x1, y1))
+
+    @staticmethod
+    def _bounds(shape, x):
+        """Inclusive bounds of an entity shape if it were placed at x."""
+        if isinstance(shape, vectorio.Circle):
+            r = shape.radius
+            return x - r, shape.y - r, x + r, shape.y + r
+        return x, shape.y, x + shape.width - 1, shape.y + shape.height - 1
+
+    # ---------------- Screens ----------------
+    def show_text(self, lines):
+        """Shows a static screen of (text, x, y, scale) lines."""
+        group = displayio.Group()
+        for text, x, y, scale in lines:
+            group.append(label.Label(terminalio.FONT, text=text, scale=scale, x=x, y=y, color=WHITE))
+        self.display.root_group = group
+
+    def begin_boot(self, lines, x, y):
+        boot_group = displayio.Group()
+        for text, lx, ly, scale in lines:
+            boot_group.append(label.Label(terminalio.FONT, text=text, scale=scale, x=lx, y=ly, color=WHITE))
+
+        # Create the runner graphic
+        runner_group = displayio.Group()
+        # Head (Circle)
+        head = vectorio.Circle(pixel_shader=self._palette, radius=3, x=0, y=0)
+        # Body (Triangle)
+        body_points = [(-3, 3), (3, 3), (0, 10)]
+        body = vectorio.Polygon(pixel_shader=self._palette, points=body_points, x=0, y=0)
+        runner_group.append(head)
+        runner_group.append(body)
+        boot_group.append(runner_group)
+        self._boot_runner = runner_group
+
+        self.move_boot_runner(x, y)
+        self.display.root_group = boot_group
+
+    def move_boot_runner(self, x, y):
+        self._boot_runner.x = x
+        self._boot_runner.y = y
+
+    # ---------------- Game Scene ----------------
+    def begin_game(self):
+        # Swapping root_group makes displayio redraw the whole screen
+        self.display.root_group = self.game_group
+        self._mark(0, 0, self.width - 1, self.height - 1)
+
+    def set_player(self, x, y):
+        shape = self.player_shape
+        if shape.x == x and shape.y == y: return
+        self._mark(min(x, shape.x), min(y, shape.y), max(x, shape.x) + 8, max(y, shape.y) + 12)
+        shape.x = x
+        shape.y = y
+
+    def add_obstacle(self, x, y):
+        shape = vectorio.Rectangle(pixel_shader=self._palette, width=10, height=10, x=x, y=y-5)
+        self.game_group.append(shape)
+        self._mark(*self._bounds(shape, x))
+        return shape
+
+    def add_coin(self, x, y):
+        shape = vectorio.Circle(pixel_shader=self._palette, radius=4, x=x, y=y)
+        self.game_group.append(shape)
+        self._mark(*self._bounds(shape, x))
+        return shape
+
+    def move(self, shape, x):
+        old_x = shape.x
+        if old_x == x: return
+        x0, y0, _, _ = self._bounds(shape, min(x, old_x))
+        _, _, x1, y1 = self._bounds(shape, max(x, old_x))
+        self._mark(x0, y0, x1, y1)
+        shape.x = x
+
+    def remove(self, shape):
+        self.game_group.remove(shape)
+        self._mark(*self._bounds(shape, shape.x))
+
+    def clear_entities(self):
+        # Remove entities from display group, keep UI
+        while len(self.game_group) > self._ui_count: self.game_group.pop()
+
+    def _set_label(self, lbl, text):
+        old = lbl.text
+        if old == text: return
+        lbl.text = text
+        # terminalio glyphs are 6 px wide and 12 px tall, centred on y
+        self._mark(lbl.x, lbl.y - 6, lbl.x + 6 * max(len(old), len(text)) - 1, lbl.y + 6)
+
+    def set_hud(self, score, level, time_left):
+        self._set_label(self.score_label, f"Score:{score}")
+        self._set_label(self.level_label, f"Lv:{level}")
+        self._set_label(self.time_label, f"T:{time_left}")
+
+    def end_frame(self):
+        """Closes the frame and returns the estimated bytes displayio will send for it."""
+        sent = 0
+        for x0, y0, x1, y1 in self._dirty:
+            if x0 < 0: x0 = 0
+            if y0 < 0: y0 = 0
+            if x1 >= self.width: x1 = self.width - 1
+            if y1 >= self.height: y1 = self.height - 1
+            if x0 > x1 or y0 > y1: continue
+            pages = (y1 >> 3) - (y0 >> 3) + 1
+            # Column/page window commands + control byte, then one byte per column per page
+            sent += 7 + 1 + (x1 - x0 + 1) * pages
+        self._dirty.clear()
+        self.bytes_sent = sent
+        self.total_bytes_sent += sent
+        self.frames += 1
+        return sent
+
+    def reset_stats(self):
+        self._dirty.clear()
+        self.bytes_sent = 0
+        self.total_bytes_sent = 0
+        self.frames = 0
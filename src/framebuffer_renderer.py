@@ -0,0 +1,466 @@
+from adafruit_bus_device.i2c_device import I2CDevice
+
+# 5x7 column font for ASCII 0x20-0x5F, one byte per column, LSB = top row.
+# Lower-case letters are drawn with their upper-case glyphs.
+_FONT = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00,  # ' '
+    0x00, 0x00, 0x5F, 0x00, 0x00,  # !
+    0x00, 0x07, 0x00, 0x07, 0x00,  # "
+    0x14, 0x7F, 0x14, 0x7F, 0x14,  # #
+    0x24, 0x2A, 0x7F, 0x2A, 0x12,  # $
+    0x23, 0x13, 0x08, 0x64, 0x62,  # %
+    0x36, 0x49, 0x55, 0x22, 0x50,  # &
+    0x00, 0x05, 0x03, 0x00, 0x00,  # '
+    0x00, 0x1C, 0x22, 0x41, 0x00,  # (
+    0x00, 0x41, 0x22, 0x1C, 0x00,  # )
+    0x08, 0x2A, 0x1C, 0x2A, 0x08,  # *
+    0x08, 0x08, 0x3E, 0x08, 0x08,  # +
+    0x00, 0x50, 0x30, 0x00, 0x00,  # ,
+    0x08, 0x08, 0x08, 0x08, 0x08,  # -
+    0x00, 0x60, 0x60, 0x00, 0x00,  # .
+    0x20, 0x10, 0x08, 0x04, 0x02,  # /
+    0x3E, 0x51, 0x49, 0x45, 0x3E,  # 0
+    0x00, 0x42, 0x7F, 0x40, 0x00,  # 1
+    0x42, 0x61, 0x51, 0x49, 0x46,  # 2
+    0x21, 0x41, 0x45, 0x4B, 0x31,  # 3
+    0x18, 0x14, 0x12, 0x7F, 0x10,  # 4
+    0x27, 0x45, 0x45, 0x45, 0x39,  # 5
+    0x3C, 0x4A, 0x49, 0x49, 0x30,  # 6
+    0x01, 0x71, 0x09, 0x05, 0x03,  # 7
+    0x36, 0x49, 0x49, 0x49, 0x36,  # 8
+    0x06, 0x49, 0x49, 0x29, 0x1E,  # 9
+    0x00, 0x36, 0x36, 0x00, 0x00,  # :
+    0x00, 0x56, 0x36, 0x00, 0x00,  # ;
+    0x08, 0x14, 0x22, 0x41, 0x00,  # <
+    0x14, 0x14, 0x14, 0x14, 0x14,  # =
+    0x00, 0x41, 0x22, 0x14, 0x08,  # >
+    0x02, 0x01, 0x51, 0x09, 0x06,  # ?
+    0x32, 0x49, 0x79, 0x41, 0x3E,  # @
+    0x7E, 0x11, 0x11, 0x11, 0x7E,  # A
+    0x7F, 0x49, 0x49, 0x49, 0x36,  # B
+    0x3E, 0x41, 0x41, 0x41, 0x22,  # C
+    0x7F, 0x41, 0x41, 0x22, 0x1C,  # D
+    0x7F, 0x49, 0x49, 0x49, 0x41,  # E
+    0x7F, 0x09, 0x09, 0x01, 0x01,  # F
+    0x3E, 0x41, 0x41, 0x51, 0x32,  # G
+    0x7F, 0x08, 0x08, 0x08, 0x7F,  # H
+    0x00, 0x41, 0x7F, 0x41, 0x00,  # I
+    0x20, 0x40, 0x41, 0x3F, 0x01,  # J
+    0x7F, 0x08, 0x14, 0x22, 0x41,  # K
+    0x7F, 0x40, 0x40, 0x40, 0x40,  # L
+    0x7F, 0x02, 0x04, 0x02, 0x7F,  # M
+    0x7F, 0x04, 0x08, 0x10, 0x7F,  # N
+    0x3E, 0x41, 0x41, 0x41, 0x3E,  # O
+    0x7F, 0x09, 0x09, 0x09, 0x06,  # P
+    0x3E, 0x41, 0x51, 0x21, 0x5E,  # Q
+    0x7F, 0x09, 0x19, 0x29, 0x46,  # R
+    0x46, 0x49, 0x49, 0x49, 0x31,  # S
+    0x01, 0x01, 0x7F, 0x01, 0x01,  # T
+    0x3F, 0x40, 0x40, 0x40, 0x3F,  # U
+    0x1F, 0x20, 0x40, 0x20, 0x1F,  # V
+    0x7F, 0x20, 0x18, 0x20, 0x7F,  # W
+    0x63, 0x14, 0x08, 0x14, 0x63,  # X
+    0x03, 0x04, 0x78, 0x04, 0x03,  # Y
+    0x61, 0x51, 0x49, 0x45, 0x43,  # Z
+    0x00, 0x7F, 0x41, 0x41, 0x00,  # [
+    0x02, 0x04, 0x08, 0x10, 0x20,  # backslash
+    0x00, 0x41, 0x41, 0x7F, 0x00,  # ]
+    0x04, 0x02, 0x01, 0x02, 0x04,  # ^
+    0x40, 0x40, 0x40, 0x40, 0x40,  # _
+))
+
+# Half-heights of the filled coin circle (radius 4) and boot runner head (radius 3)
+_COIN_SPANS = (0, 2, 3, 3, 4, 3, 3, 2, 0)
+_HEAD_SPANS = (0, 2, 2, 3, 2, 2, 0)
+
+# Unchanged columns worth re-sending rather than opening a new column window
+# (7 command bytes + 1 control byte)
+_SEGMENT_GAP = 8
+
+# Column windows that can be carried from one page to the next
+_MAX_WINDOWS = 16
+
+# Kinds of retained shapes
+_OBSTACLE = 0
+_COIN = 1
+
+
+class FramebufferRenderer:
+    """
+    FramebufferRenderer(i2c, width=128, height=64, *, address=0x3C)
+
+    Draws the game straight into a 1bpp off-screen buffer laid out like the
+    SSD1306 GDDRAM (one byte = 8 vertical pixels of one column, 128 bytes per
+    8-row page) and talks to the controller directly over I2C, bypassing displayio.
+
+    - Every frame is redrawn from scratch. Drawing records the columns it
+      touches on each page, so only those (and the ones the last frame sent
+      touched) are compared with what the controller shows.
+    - Runs of changed columns are written through column/page windows; a run
+      on the next page with about the same columns extends the window down,
+      so a shape straddling two pages goes out as one multi-page transfer.
+    - bytes_sent: I2C payload bytes (commands + data) written by the last frame.
+    - total_bytes_sent / frames: running totals since the last reset_stats().
+    """
+
+    def __init__(self, i2c, width=128, height=64, *, address=0x3C):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self._device = I2CDevice(i2c, address)
+
+        # Byte 0 is the I2C "data follows" control byte, the frame starts at byte 1
+        self._buffer = bytearray(1 + width * self.pages)
+        self._buffer[0] = 0x40
+        self._sent = bytearray(width * self.pages)  # Copy of what the controller shows
+        self._sent_view = memoryview(self._sent)
+        self._frame = memoryview(self._buffer)[1:]  # The frame without the control byte
+        self._blank = bytes(width * self.pages)
+        self._cmd = bytearray(8)                    # Scratch buffer for command writes
+        self._gather = bytearray(1 + width * self.pages)  # Multi-page window data
+        self._gather[0] = 0x40
+        self._force = True                          # Controller RAM is unknown at start
+
+        # Touched columns per page: first in _lo (0xFF = none), last + 1 in _hi.
+        # _shown_* hold the same for the frame the controller shows.
+        self._lo = bytearray(b"\xff" * self.pages)
+        self._hi = bytearray(self.pages)
+        self._shown_lo = bytearray(b"\xff" * self.pages)
+        self._shown_hi = bytearray(self.pages)
+
+        # Windows (first page, first column, last column) reaching the previous
+        # page, and the ones reaching the current page
+        self._open = bytearray(3 * _MAX_WINDOWS)
+        self._open_n = 0
+        self._carry = bytearray(3 * _MAX_WINDOWS)
+        self._carry_n = 0
+        self._page = 0
+
+        # Retained scene, mirrors the displayio scene graph
+        self._shapes = []
+        self._player = None
+        self._hud = None
+        self._hud_page = bytearray(width)  # HUD rasterised into page 0, redrawn on change
+        self._hud_lo = 0xFF
+        self._hud_hi = 0
+        self._text = None
+
+        self.bytes_sent = 0
+        self.total_bytes_sent = 0
+        self.frames = 0
+
+        self._init_display()
+
+    # ---------------- SSD1306 ----------------
+    def _write_cmd(self, *cmds):
+        """Sends a run of command bytes behind a single 0x00 control byte (setup only)."""
+        buf = self._cmd
+        buf[0] = 0x00
+        n = len(cmds)
+        for i in range(n): buf[i + 1] = cmds[i]
+        with self._device as device:
+            device.write(buf, end=n + 1)
+        self.bytes_sent += n + 1
+
+    def _init_display(self):
+        self._write_cmd(0xAE)                    # Display off
+        self._write_cmd(0x20, 0x00)              # Horizontal addressing mode
+        self._write_cmd(0x40, 0xA1, 0xC8)        # Start line 0, segment remap, COM scan dec
+        self._write_cmd(0xA8, self.height - 1)   # Multiplex ratio
+        self._write_cmd(0xD3, 0x00)              # Display offset
+        self._write_cmd(0xDA, 0x12 if self.height == 64 else 0x02)  # COM pins
+        self._write_cmd(0xD5, 0x80, 0xD9, 0xF1)  # Clock divide, pre-charge
+        self._write_cmd(0xDB, 0x30, 0x81, 0xFF)  # VCOMH deselect, contrast
+        self._write_cmd(0xA4, 0xA6, 0x8D, 0x14)  # Resume RAM, normal, charge pump on
+        self._write_cmd(0xAF)                    # Display on
+
+    def _send_window(self, first, last, col_first, col_last):
+        """Writes columns col_first..col_last of pages first..last (inclusive) in one transfer."""
+        cmd = self._cmd
+        cmd[0] = 0x00
+        cmd[1] = 0x21
+        cmd[2] = col_first
+        cmd[3] = col_last
+        cmd[4] = 0x22
+        cmd[5] = first
+        cmd[6] = last
+        w = self.width
+        if first == last:
+            # Borrow the byte in front of the columns for the control byte
+            data = self._buffer
+            start = first * w + col_first
+            end = first * w + col_last + 2
+            saved = data[start]
+            data[start] = 0x40
+        else:
+            # The window wraps to the next page after col_last, gather the columns
+            data = self._gather
+            buf = self._buffer
+            start = 0
+            end = 1
+            for page in range(first, last + 1):
+                a = 1 + page * w
+                for c in range(col_first, col_last + 1):
+                    data[end] = buf[a + c]
+                    end += 1
+        with self._device as device:
+            device.write(cmd, end=7)
+            device.write(data, start=start, end=end)
+        if first == last: data[start] = saved
+        self.bytes_sent += 7 + end - start
+
+    def _add_segment(self, page, col_first, col_last):
+        """Queues changed columns of a page, extending a window from the page above when cheaper."""
+        windows = self._open
+        for i in range(self._open_n):
+            j = 3 * i
+            first = windows[j]
+            if first == 0xFF: continue  # Already extended
+            c0 = windows[j + 1]
+            c1 = windows[j + 2]
+            m0 = col_first if col_first < c0 else c0
+            m1 = col_last if col_last > c1 else c1
+            pages = page - first
+            # Merged: one window over all pages. Apart: the old window plus a new one.
+            if (pages + 1) * (m1 - m0 + 1) <= pages * (c1 - c0 + 1) + col_last - col_first + 1 + _SEGMENT_GAP:
+                windows[j] = 0xFF
+                self._carry_window(first, m0, m1)
+                return
+        self._carry_window(page, col_first, col_last)
+
+    def _carry_window(self, first, col_first, col_last):
+        n = self._carry_n
+        if n == _MAX_WINDOWS:
+            self._send_window(first, self._page, col_first, col_last)
+            return
+        windows = self._carry
+        windows[3 * n] = first
+        windows[3 * n + 1] = col_first
+        windows[3 * n + 2] = col_last
+        self._carry_n = n + 1
+
+    def _flush_open(self, last):
+        """Sends the windows that were not extended to the page after `last`."""
+        windows = self._open
+        for i in range(self._open_n):
+            j = 3 * i
+            if windows[j] != 0xFF: self._send_window(windows[j], last, windows[j + 1], windows[j + 2])
+        # Windows reaching this page become the ones reaching the previous page
+        self._open, self._carry = self._carry, self._open
+        self._open_n = self._carry_n
+        self._carry_n = 0
+
+    def show(self):
+        """Sends every part of the frame that differs from what the controller shows, returns the bytes written."""
+        self.bytes_sent = 0
+        buf = self._buffer
+        sent = self._sent
+        w = self.width
+        lo = self._lo
+        hi = self._hi
+        shown_lo = self._shown_lo
+        shown_hi = self._shown_hi
+        frame = self._frame
+        shown = self._sent_view
+        self._open_n = 0
+        self._carry_n = 0
+        for page in range(self.pages):
+            self._page = page
+            a = page * w
+            if self._force:
+                for c in range(w): sent[a + c] = buf[a + 1 + c]
+                self._add_segment(page, 0, w - 1)
+            else:
+                # Only columns drawn in this frame or the one shown can differ
+                c_first = lo[page] if lo[page] < shown_lo[page] else shown_lo[page]
+                c_end = hi[page] if hi[page] > shown_hi[page] else shown_hi[page]
+                # One C-level compare first, most candidate ranges are unchanged
+                if c_first >= c_end or frame[a + c_first:a + c_end] == shown[a + c_first:a + c_end]:
+                    c_end = c_first
+                # Byte-by-byte scan (no slices on the heap), changed bytes are
+                # grouped into segments unless the gap is dearer than a new window
+                seg_first = -1
+                seg_last = -1
+                for c in range(c_first, c_end):
+                    b = buf[a + 1 + c]
+                    if b == sent[a + c]: continue
+                    sent[a + c] = b
+                    if seg_first < 0:
+                        seg_first = c
+                    elif c - seg_last > _SEGMENT_GAP:
+                        self._add_segment(page, seg_first, seg_last)
+                        seg_first = c
+                    seg_last = c
+                if seg_first >= 0: self._add_segment(page, seg_first, seg_last)
+            self._flush_open(page - 1)
+            shown_lo[page] = lo[page]
+            shown_hi[page] = hi[page]
+        self._flush_open(self.pages - 1)
+        self._force = False
+        return self.bytes_sent
+
+    # ---------------- Drawing Primitives ----------------
+    def clear(self):
+        self._frame[:] = self._blank
+        lo = self._lo
+        hi = self._hi
+        for page in range(self.pages):
+            lo[page] = 0xFF
+            hi[page] = 0
+
+    def vline(self, x, y0, y1):
+        """Sets pixels x,y0..y1 (inclusive), OR-ing whole bytes per page."""
+        if x < 0 or x >= self.width: return
+        if y0 < 0: y0 = 0
+        if y1 >= self.height: y1 = self.height - 1
+        if y0 > y1: return
+        buf = self._buffer
+        lo = self._lo
+        hi = self._hi
+        w = self.width
+        p0 = y0 >> 3
+        p1 = y1 >> 3
+        top = (0xFF << (y0 & 7)) & 0xFF
+        bottom = 0xFF >> (7 - (y1 & 7))
+        for p in range(p0, p1 + 1):
+            mask = 0xFF
+            if p == p0: mask &= top
+            if p == p1: mask &= bottom
+            buf[1 + p * w + x] |= mask
+            if x < lo[p]: lo[p] = x
+            if x >= hi[p]: hi[p] = x + 1
+
+    def fill_rect(self, x, y, width, height):
+        for col in range(x, x + width): self.vline(col, y, y + height - 1)
+
+    def text(self, string, x, y, scale=1):
+        """Draws string with its top-left corner at x, y (6 px per character)."""
+        buf = self._buffer
+        lo = self._lo
+        hi = self._hi
+        w = self.width
+        for ch in string:
+            code = ord(ch)
+            if 0x61 <= code <= 0x7A: code -= 0x20  # Lower case -> upper case
+            if code < 0x20 or code > 0x5F: code = 0x3F  # Unknown -> '?'
+            base = (code - 0x20) * 5
+            for col in range(5):
+                bits = _FONT[base + col]
+                if not bits: continue
+                if scale == 1:
+                    cx = x + col
+                    if cx < 0 or cx >= w: continue
+                    page = y >> 3
+                    shift = y & 7
+                    for p in range(page, page + 2 if shift else page + 1):
+                        if p < 0 or p >= self.pages: continue
+                        if p == page: buf[1 + p * w + cx] |= (bits << shift) & 0xFF
+                        else: buf[1 + p * w + cx] |= bits >> (8 - shift)
+                        if cx < lo[p]: lo[p] = cx
+                        if cx >= hi[p]: hi[p] = cx + 1
+                else:
+                    for row in range(7):
+                        if bits & (1 << row):
+                            self.fill_rect(x + col * scale, y + row * scale, scale, scale)
+            x += 6 * scale
+
+    def _draw_spans(self, cx, cy, spans):
+        """Draws a shape symmetric around cx, cy given its half-height per column."""
+        r = len(spans) // 2
+        for i in range(len(spans)):
+            h = spans[i]
+            self.vline(cx - r + i, cy - h, cy + h)
+
+    def _draw_player(self, x, y):
+        # Triangle (0, 0), (0, 12), (8, 6), narrowing by 3/4 px per column
+        for col in range(9):
+            inset = (col * 3) // 4
+            self.vline(x + col, y + inset, y + 12 - inset)
+
+    def _draw_runner(self, x, y):
+        # Head circle at x, y plus body triangle (-3, 3), (3, 3), (0, 10)
+        self._draw_spans(x, y, _HEAD_SPANS)
+        for dx in range(-3, 4):
+            self.vline(x + dx, y + 3, y + 10 - (abs(dx) * 7) // 3)
+
+    def _draw_lines(self, lines):
+        # Label y is the vertical middle of the text, the font is 8 px tall
+        for text, x, y, scale in lines: self.text(text, x, y - 4 * scale, scale)
+
+    # ---------------- Screens ----------------
+    def show_text(self, lines):
+        """Shows a static screen of (text, x, y, scale) lines."""
+        self.clear()
+        self._draw_lines(lines)
+        self.show()
+
+    def begin_boot(self, lines, x, y):
+        self._text = lines
+        self.move_boot_runner(x, y)
+
+    def move_boot_runner(self, x, y):
+        self.clear()
+        self._draw_lines(self._text)
+        self._draw_runner(x, y)
+        self.show()
+
+    # ---------------- Game Scene ----------------
+    def begin_game(self):
+        """Nothing to swap in, end_frame() rasterises the game scene."""
+
+    def set_player(self, x, y):
+        self._player = (x, y)
+
+    def add_obstacle(self, x, y):
+        shape = [_OBSTACLE, x, y]
+        self._shapes.append(shape)
+        return shape
+
+    def add_coin(self, x, y):
+        shape = [_COIN, x, y]
+        self._shapes.append(shape)
+        return shape
+
+    def move(self, shape, x):
+        shape[1] = x
+
+    def remove(self, shape):
+        self._shapes.remove(shape)
+
+    def clear_entities(self):
+        self._shapes.clear()
+
+    def set_hud(self, score, level, time_left):
+        hud = self._hud
+        if hud is not None and hud[0] == score and hud[1] == level and hud[2] == time_left: return
+        self._hud = (score, level, time_left)
+        # HUD text sits in rows 1-7, render it once into page 0 and keep a copy
+        w = self.width
+        self.clear()
+        self.text(f"Score:{score}", 0, 1)
+        self.text(f"Lv:{level}", 50, 1)
+        self.text(f"T:{time_left}", 90, 1)
+        self._hud_page[:] = self._frame[0:w]
+        self._hud_lo = self._lo[0]
+        self._hud_hi = self._hi[0]
+
+    def end_frame(self):
+        """Rasterises the game scene, sends the dirty pages and returns the bytes sent."""
+        self.clear()
+        if self._hud is not None:
+            self._frame[0:self.width] = self._hud_page
+            self._lo[0] = self._hud_lo
+            self._hi[0] = self._hud_hi
+        for kind, x, y in self._shapes:
+            if kind == _OBSTACLE: self.fill_rect(x, y - 5, 10, 10)
+            else: self._draw_spans(x, y, _COIN_SPANS)
+        if self._player is not None: self._draw_player(*self._player)
+        sent = self.show()
+        self.total_bytes_sent += sent
+        self.frames += 1
+        return sent
+
+    def reset_stats(self):
+        self.bytes_sent = 0
+        self.total_bytes_sent = 0
+        self.frames = 0
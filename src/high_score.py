@@ -0,0 +1,57 @@
+import microcontroller
+
+
+class HighScoreHandler:
+    """
+    Handles reading and writing high scores to the microcontroller's
+    Non-Volatile Memory (NVM) so scores persist after power off.
+    """
+    def __init__(self):
+        # 5 bytes per entry, 2 score + 3 name, 3 entries allowed
+        self.entry_size = 5       # bytes per high-score entry
+        self.total_entries = 3    # 3 stored scores
+        
+        # Check if NVM is empty (0xFF), if so, reset to defaults
+        if microcontroller.nvm[0] == 255: self.reset_nvm()
+
+    def reset_nvm(self):
+        """Resets NVM to default values (Score: 0, Name: AAA)"""
+        default_data = []
+        for _ in range(self.total_entries):
+            # 0, 0 = Score 0; 65 = 'A'
+            default_data.extend([0, 0, ord('A'), ord('A'), ord('A')])
+        for i in range(len(default_data)):
+            microcontroller.nvm[i] = default_data[i]
+
+    def get_scores(self):
+        """Reads scores from NVM and returns a list of dictionaries."""
+        scores = []
+        for i in range(self.total_entries):
+            start = i * self.entry_size
+            # Reconstruct 16-bit score from 2 bytes
+            score = (microcontroller.nvm[start] << 8) | microcontroller.nvm[start+1]
+            # Reconstruct name from 3 bytes
+            name = ""
+            for j in range(3): name += chr(microcontroller.nvm[start + 2 + j])
+            scores.append({'score': score, 'name': name})
+        return scores
+
+    def is_high_score(self, new_score):
+        """Checks if the new score is higher than the lowest saved score."""
+        scores = self.get_scores()
+        return new_score > scores[-1]['score']
+
+    def save_score(self, new_score, new_name):
+        """Saves a new high score, sorts the list, and writes back to NVM."""
+        scores = self.get_scores()
+        scores.append({'score': new_score, 'name': new_name})
+        # Sort by score descending
+        scores.sort(key=lambda x: x['score'], reverse=True)
+        # Keep only top 3
+        scores = scores[:3]
+        # Write to memory
+        for i, entry in enumerate(scores):
+            start = i * self.entry_size
+            microcontroller.nvm[start] = (entry['score'] >> 8) & 0xFF # High byte
+            microcontroller.nvm[start+1] = entry['score'] & 0xFF # Low byte
+            for j in range(3): microcontroller.nvm[start + 2 + j] = ord(entry['name'][j])
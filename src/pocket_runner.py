@@ -0,0 +1,204 @@
+import time
+import random
+
+
+class PocketRunner:
+    def __init__(self, renderer):
+        # Y-coordinates for the 3 lanes
+        self.lane_coords = [12, 32, 52] 
+        self.current_lane_index = 1 
+        
+        # Game State Variables
+        self.score = 0
+        self.level = 1
+        self.speed = 3
+        self.difficulty = "Easy"
+        
+        # Obstacle Spawning Rhythm
+        self.spawn_timer = 0
+        self.min_spawn_gap = 20
+        self.max_spawn_gap = 40
+        self.spawn_rate = 0
+        
+        # Player Position
+        self.player_x = 10.0
+        
+        # Time Management
+        self.level_duration = 5
+        self.level_start_time = 0
+        self.time_left = 5
+        self.game_start_time = 0 # Global start time
+        
+        # LED Timers
+        self.coin_flash_timer = 0 
+        self.level_flash_timer = 0
+        self.coins_spawned_this_level = 0
+        
+        # Entities
+        self.obstacles = [] 
+        self.coins = []     
+        
+        # Graphics (displayio or framebuffer backend)
+        self.renderer = renderer
+        self.update_player_pos()
+
+    def set_difficulty(self, mode):
+        """Sets parameters based on selected difficulty."""
+        self.difficulty = mode
+        if mode == "Easy":
+            self.speed = 2
+            self.min_spawn_gap = 40
+            self.max_spawn_gap = 70 
+        elif mode == "Medium":
+            self.speed = 3
+            self.min_spawn_gap = 25
+            self.max_spawn_gap = 50
+        elif mode == "Hard":
+            self.speed = 5
+            self.min_spawn_gap = 15
+            self.max_spawn_gap = 30
+            
+    def spawn_entity(self):
+        """Handles spawning of Obstacles and Coins."""
+        # Rhythm check
+        if self.spawn_timer > 0:
+            self.spawn_timer -= 1
+            return 
+
+        # Prevent clogging, don't spawn if too many obstacles on right side
+        recent_obstacles_count = 0
+        for obs in self.obstacles:
+            if obs["x"] > 100: recent_obstacles_count += 1
+        if recent_obstacles_count >= 2:
+            self.spawn_timer = 5
+            return
+
+        # 1. ALWAYS spawn an Obstacle
+        obs_lane_idx = random.randint(0, 2) 
+        obs_y = self.lane_coords[obs_lane_idx]
+        
+        shape = self.renderer.add_obstacle(130, obs_y)
+        self.obstacles.append({"shape": shape, "x": 130, "y": obs_y})
+
+        # 2. Try to spawn a Coin: max 2 per 5-sec interval
+        if self.coins_spawned_this_level < 2:
+            # Find a lane that is NOT occupied by the obstacle
+            available_lanes = [0, 1, 2]
+            available_lanes.remove(obs_lane_idx)
+            
+            coin_lane_idx = random.choice(available_lanes)
+            coin_y = self.lane_coords[coin_lane_idx]
+            
+            c_shape = self.renderer.add_coin(130, coin_y)
+            self.coins.append({"shape": c_shape, "x": 130, "y": coin_y})
+            
+            self.coins_spawned_this_level += 1 # Increment counter
+        # Reset timer for next spawn
+        self.spawn_timer = random.randint(self.min_spawn_gap, self.max_spawn_gap)
+
+    def update_level(self, total_elapsed):
+        """Auto level up every 5 seconds, returns True when the level changed."""
+        current_stage = int(total_elapsed // 5) + 1
+        if current_stage <= self.level: return False
+
+        self.level = current_stage
+        self.coins_spawned_this_level = 0 # Reset coin limit for new level
+        
+        # Make obstacles denser
+        if self.min_spawn_gap > 10: self.min_spawn_gap -= 2
+        if self.max_spawn_gap > 15: self.max_spawn_gap -= 4
+        
+        # Trigger Yellow LED for level up
+        self.level_flash_timer = 20
+        return True
+
+    def move_entities(self):
+        """Moves obstacles and coins to the left and removes those that left the screen."""
+        for entity in self.obstacles + self.coins:
+            entity["x"] -= self.speed 
+            self.renderer.move(entity["shape"], int(entity["x"]))
+            
+            # Remove objects that go off-screen
+            if entity["x"] < -10:
+                if entity in self.obstacles:
+                    self.obstacles.remove(entity)
+                    self.renderer.remove(entity["shape"])
+                elif entity in self.coins:
+                    self.coins.remove(entity)
+                    self.renderer.remove(entity["shape"])
+
+    def reset_game(self):
+        """Resets all game variables for a new session."""
+        self.score = 0
+        self.level = 1
+        self.player_x = 10.0
+        self.obstacles.clear()
+        self.coins.clear()
+        # Remove entities from the screen, keep UI
+        self.renderer.clear_entities()
+        self.renderer.reset_stats()
+        self.set_difficulty(self.difficulty)
+        self.current_lane_index = 1
+        self.update_player_pos()
+        # Record global start time
+        self.game_start_time = time.monotonic()
+        
+
+    def update_player_pos(self):
+        """Updates player visual position."""
+        # Constrain X position
+        if self.player_x < 0: self.player_x = 0
+        if self.player_x > 115: self.player_x = 115
+        self.renderer.set_player(int(self.player_x), self.lane_coords[self.current_lane_index] - 6)
+
+    def check_collision(self):
+        """Checks collisions between Player and Obstacles/Coins."""
+        player_x = int(self.player_x) + 4
+        player_y = self.lane_coords[self.current_lane_index]
+        
+        # Check Coins
+        for coin in self.coins[:]:
+            if abs(coin["x"] - player_x) < 15 and abs(coin["y"] - player_y) < 10:
+                self.coins.remove(coin)
+                self.renderer.remove(coin["shape"])
+                self.score += 1
+                self.coin_flash_timer = 10    # Trigger Green LED
+        # Check Obstacles        
+        for obs in self.obstacles[:]:
+            if abs(obs["x"] - player_x) < 12 and abs(obs["y"] - player_y) < 10:
+                return True     # Collision detected
+        return False
+
+
+# Screen Drawing Helpers
+    # Each screen is a list of (text, x, y, scale) lines handed to the renderer
+    def draw_title_screen(self):
+        lines = [("POCKET RUNNER", 25, 20, 1), (">>> PLAY <<<", 25, 45, 1)]
+        self.renderer.show_text(lines)
+
+    def draw_menu(self, idx):
+        lines = [("DIFFICULTY", 35, 10, 1)]
+        opts = ["Easy", "Medium", "Hard"]
+        for i, opt in enumerate(opts):
+            prefix = "> " if i == idx else "  "
+            lines.append((prefix + opt, 30, 30 + (i*12), 1))
+        self.renderer.show_text(lines)
+
+    def draw_end_screen(self, title_text):
+        lines = [(title_text, 10, 20, 2), (f"Score: {self.score}", 45, 45, 1), ("CONTINUE", 45, 58, 1)]
+        self.renderer.show_text(lines)
+
+    def draw_input_screen(self, char_index, current_chars):
+        display_text = ""
+        for i in range(3):
+            if i == char_index: display_text += f"[{current_chars[i]}] "
+            else: display_text += f" {current_chars[i]}  "
+        lines = [("NEW HIGH SCORE!", 20, 10, 1), (display_text, 25, 35, 1)]
+        self.renderer.show_text(lines)
+
+    def draw_highscore_board(self, scores_list):
+        lines = [("TOP SCORES", 35, 5, 1)]
+        for i, entry in enumerate(scores_list):
+            y_pos = 20 + (i * 15)
+            lines.append((f"{i+1}. {entry['name']}   {entry['score']}", 20, y_pos, 1))
+        self.renderer.show_text(lines)